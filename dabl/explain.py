@@ -1,4 +1,5 @@
 import numpy as np
+import pandas as pd
 from warnings import warn
 
 import matplotlib.pyplot as plt
@@ -7,7 +8,7 @@ from sklearn.tree import DecisionTreeClassifier, plot_tree
 from sklearn.ensemble import RandomForestClassifier
 from sklearn.pipeline import Pipeline
 from sklearn.metrics import classification_report, confusion_matrix
-from sklearn.inspection import plot_partial_dependence
+from sklearn.inspection import plot_partial_dependence, partial_dependence
 from sklearn.feature_selection import SelectFromModel
 
 from .models import SimpleClassifier, SimpleRegressor, AnyClassifier
@@ -32,7 +33,7 @@ def classification_metrics(estimator, X_val, y_val):
 
 
 def explain(estimator, X_val=None, y_val=None, target_col=None,
-            feature_names=None):
+            feature_names=None, approximate_pd=False):
     """Explain estimator.
 
     Provide basic properties and evaluation plots for the estimator.
@@ -51,6 +52,12 @@ def explain(estimator, X_val=None, y_val=None, target_col=None,
 
     target_col : string or int, optional
         Column name of target if included in X.
+
+    approximate_pd : bool, default=False
+        Whether to approximate partial dependence plots by varying each
+        feature in a single exemplar row (medians for numeric and modes for
+        other features) instead of averaging over all rows of X_val.
+        Much faster for large X_val, but ignores interactions.
     """
     if feature_names is None:
         try:
@@ -130,7 +137,7 @@ def explain(estimator, X_val=None, y_val=None, target_col=None,
             print("Computing partial dependence plots...")
             n_rows, n_cols = find_pretty_grid(len(features))
             try:
-                if n_classes <= 2:
+                if n_classes <= 2 and not approximate_pd:
                     plot = plot_partial_dependence(
                         estimator, X_val, features=features,
                         feature_names=feature_names, n_cols=n_cols)
@@ -138,28 +145,113 @@ def explain(estimator, X_val=None, y_val=None, target_col=None,
                     for ax in plot.axes_.ravel():
                         ax.set_ylabel('')
                 else:
-                    for c in estimator.classes_:
-                        plot = plot_partial_dependence(
-                            estimator, X_val, features=features,
-                            feature_names=feature_names,
-                            target=c, n_cols=n_cols)
-                        plot.figure_.suptitle(
-                            "Partial Dependence for class {}".format(c))
-                        for ax in plot.axes_.ravel():
-                            ax.set_ylabel('')
+                    # compute partial dependence for all classes at once
+                    # instead of redoing the grid predictions per class
+                    # scikit-learn 0.21 only accepts integer features
+                    feature_idx = [list(feature_names).index(feature)
+                                   for feature in features]
+                    if approximate_pd:
+                        exemplar = _exemplar_row(X_val)
+                        pds = [_approximate_partial_dependence(
+                            estimator, X_val, idx, exemplar)
+                            for idx in feature_idx]
+                    else:
+                        pds = [_partial_dependence(estimator, X_val, idx)
+                               for idx in feature_idx]
+                    if n_classes > 2:
+                        titles = ["Partial Dependence for class {}".format(c)
+                                  for c in estimator.classes_]
+                    else:
+                        titles = ["Partial Dependence"]
+                    for k, title in enumerate(titles):
+                        fig, axes = _make_subplots(len(features))
+                        for ax, feature, (averaged, grid) in zip(
+                                axes.ravel(), features, pds):
+                            ax.plot(grid, averaged[k])
+                            ax.set_xlabel(feature)
+                        for ax in axes.ravel()[len(features):]:
+                            # turn off axis if we didn't fill last row
+                            ax.set_axis_off()
+                        fig.suptitle(title)
             except ValueError as e:
                 warn("Couldn't run partial dependence plot: " + str(e))
 
 
+def _partial_dependence(estimator, X, feature, grid_resolution=100):
+    # averaged predictions for all outputs, and the grid they were computed on
+    # feature is the column index in X
+    result = partial_dependence(estimator, X, [feature],
+                                grid_resolution=grid_resolution)
+    if isinstance(result, tuple):
+        averaged, values = result
+    else:
+        # newer scikit-learn returns a Bunch
+        averaged, values = result['average'], result['values']
+    return averaged, values[0]
+
+
+def _exemplar_row(X):
+    # medians for numeric and most frequent values for other columns
+    X = pd.DataFrame(X)
+    numeric = X.select_dtypes('number').columns
+    other = [col for col in X.columns if col not in numeric]
+    exemplar = pd.Series(index=X.columns, dtype=object)
+    exemplar[numeric] = X[numeric].median()
+    if other:
+        exemplar[other] = X[other].mode().iloc[0]
+    return exemplar
+
+
+def _approximate_partial_dependence(estimator, X, feature, exemplar,
+                                    grid_resolution=100):
+    # vary feature in a single exemplar row instead of in every row of X
+    # feature is the column index in X
+    is_frame = isinstance(X, pd.DataFrame)
+    X = pd.DataFrame(X)
+    values = X.iloc[:, feature]
+    if (pd.api.types.is_numeric_dtype(values)
+            and not pd.api.types.is_bool_dtype(values)):
+        # same grid as partial_dependence
+        grid = np.unique(values.dropna())
+        if len(grid) >= grid_resolution:
+            grid = np.linspace(values.quantile(0.05), values.quantile(0.95),
+                               grid_resolution)
+    else:
+        grid = values.value_counts().index[:grid_resolution].values
+    X_grid = pd.DataFrame([exemplar] * len(grid), columns=X.columns)
+    X_grid.iloc[:, feature] = grid
+    X_grid = X_grid.astype(X.dtypes.to_dict())
+    # the cast can change the grid (float grid on integer features),
+    # so report the values the estimator actually sees
+    grid = X_grid.iloc[:, feature].values
+    if not is_frame:
+        X_grid = X_grid.values
+    if hasattr(estimator, 'classes_'):
+        averaged = estimator.predict_proba(X_grid).T
+        if averaged.shape[0] == 2:
+            # only show the positive class, like partial_dependence
+            averaged = averaged[1:]
+    else:
+        averaged = np.atleast_2d(estimator.predict(X_grid))
+    return averaged, grid
+
+
+# how to get the wrapped estimator out of dabl estimators
+_UNWRAPPERS = {
+    SimpleClassifier: lambda est: est.est_,
+    SimpleRegressor: lambda est: est.est_,
+    AnyClassifier: lambda est: est.est_,
+}
+
+
 def _extract_inner_estimator(estimator, feature_names):
     # Start unpacking the estimator to get to the final step
     inner_estimator = estimator
-    if (isinstance(inner_estimator, SimpleClassifier)
-            or isinstance(inner_estimator, SimpleRegressor)):
-        # get the pipeline
-        inner_estimator = inner_estimator.est_
-    elif isinstance(inner_estimator, AnyClassifier):
-        inner_estimator = inner_estimator.est_
+    # walk the mro so subclasses are unwrapped like their parents
+    for cls in type(inner_estimator).__mro__:
+        if cls in _UNWRAPPERS:
+            inner_estimator = _UNWRAPPERS[cls](inner_estimator)
+            break
     if isinstance(inner_estimator, Pipeline):
         assert len(inner_estimator.steps) == 2
         # pipelines don't have feature names yet in sklearn
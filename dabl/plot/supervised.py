@@ -9,7 +9,7 @@ from sklearn.feature_selection import (f_regression,
                                        mutual_info_classif,
                                        f_classif)
 from sklearn.impute import SimpleImputer
-from sklearn.preprocessing import scale
+from sklearn.preprocessing import StandardScaler
 from sklearn.decomposition import PCA
 from sklearn.discriminant_analysis import LinearDiscriminantAnalysis
 from sklearn.metrics import recall_score
@@ -17,15 +17,80 @@ from sklearn.metrics import recall_score
 from ..preprocessing import detect_types, clean, guess_ordinal
 from .utils import (_check_X_target_col, _get_n_top, _make_subplots,
                     _short_tick_names, _shortname, _prune_category_make_X,
-                    find_pretty_grid, _find_scatter_plots_classification,
+                    _find_scatter_plots_classification,
                     class_hists, discrete_scatter, mosaic_plot,
                     _find_inliers, pairplot, _get_scatter_alpha,
-                    _get_scatter_size)
+                    _get_scatter_size, _get_scatter_sample, _top_k,
+                    _any_col_exceeds, _drop_outliers)
+
+
+# memoized mutual information scores, keyed on the content of the data
+_MI_CACHE = {}
+_MI_CACHE_SIZE = 32
+# mutual information is estimated on at most this many samples
+_MI_MAX_SAMPLES = 10000
+
+
+def _fingerprint(data):
+    if isinstance(data, np.ndarray):
+        return hash((data.shape, data.dtype.str, data.tobytes()))
+    return hash(pd.util.hash_pandas_object(data, index=False).values.tobytes())
+
+
+def _ordinal_encode(features):
+    # can't use OrdinalEncoder because we might have mix of int and string
+    # pandas already stores the codes in the smallest integer dtype needed,
+    # so stacking them keeps int8 for up to 127 categories
+    return np.column_stack([features[col].cat.codes.values
+                            for col in features.columns])
+
+
+def _mutual_info(ordinal_encoded, target, task, discrete_features):
+    """Mutual information of discrete features with the target.
+
+    Results are cached on the content of the inputs, so calling the
+    plotting functions repeatedly on the same data (like re-running ``plot``
+    in a notebook) doesn't recompute the estimates.
+    For large datasets, the estimate uses a random subsample of
+    ``_MI_MAX_SAMPLES`` rows.
+    """
+    key = (task, _fingerprint(ordinal_encoded), _fingerprint(target))
+    if key not in _MI_CACHE:
+        if task == "classification":
+            mutual_info = mutual_info_classif
+        else:
+            mutual_info = mutual_info_regression
+        if len(target) > _MI_MAX_SAMPLES:
+            rng = np.random.RandomState(0)
+            sample = rng.choice(len(target), _MI_MAX_SAMPLES, replace=False)
+            ordinal_encoded = ordinal_encoded[sample]
+            target = target.iloc[sample]
+        f = mutual_info(ordinal_encoded, target,
+                        discrete_features=discrete_features)
+        if len(_MI_CACHE) >= _MI_CACHE_SIZE:
+            # drop the oldest entry
+            _MI_CACHE.pop(next(iter(_MI_CACHE)))
+        _MI_CACHE[key] = f
+    return _MI_CACHE[key]
+
+
+def _lda_predict(lda, features_lda, features_scaled):
+    # If all discriminant directions are kept, we can classify in the
+    # projected space we already have instead of projecting again in predict.
+    # This is the same decision function as in the svd solver of lda.
+    if features_lda.shape[1] < lda.scalings_.shape[1]:
+        return lda.predict(features_scaled)
+    class_means = lda.transform(lda.means_)
+    decision = (np.dot(features_lda, class_means.T)
+                - 0.5 * np.sum(class_means ** 2, axis=1)
+                + np.log(lda.priors_))
+    return lda.classes_[np.argmax(decision, axis=1)]
 
 
 def plot_regression_continuous(X, target_col, types=None,
                                scatter_alpha='auto', scatter_size='auto',
-                               drop_outliers=True, **kwargs):
+                               drop_outliers=True, features_imp=None,
+                               max_scatter_points=5000, **kwargs):
     """Exploration plots for continuous features in regression.
 
     Creates plots of all the continuous features vs the target.
@@ -46,6 +111,12 @@ def plot_regression_continuous(X, target_col, types=None,
         Marker size for scatter plots. 'auto' is dirty hacks.
     drop_outliers : bool, default=True
         Whether to drop outliers when plotting.
+    features_imp : ndarray, optional
+        Continuous features (excluding the target) with missing values
+        imputed. Can be used to avoid recomputing the imputation.
+    max_scatter_points : int or None, default=5000
+        Maximum number of points to show in scatter plots. Larger datasets
+        are subsampled for plotting. None means show all points.
     """
     types = _check_X_target_col(X, target_col, types, task="regression")
 
@@ -60,25 +131,26 @@ def plot_regression_continuous(X, target_col, types=None,
     target = X[target_col]
     # HACK we should drop them per column before feeding them into f_regression
     # FIXME
-    features_imp = SimpleImputer().fit_transform(features)
+    if features_imp is None:
+        features_imp = SimpleImputer().fit_transform(features)
     f, p = f_regression(features_imp, target)
-    top_k = np.argsort(f)[-show_top:][::-1]
+    top_k = _top_k(f, show_top)
+    sample = _get_scatter_sample(target, max_scatter_points)
     # we could do better lol
     fig, axes = _make_subplots(n_plots=show_top)
 
     # FIXME this could be a function or maybe using seaborn
     plt.suptitle("Continuous Feature vs Target")
-    for i, (col_idx, ax) in enumerate(zip(top_k, axes.ravel())):
+    col_names = features.columns[top_k]
+    for i, (col_idx, col, ax) in enumerate(zip(top_k, col_names,
+                                                axes.ravel())):
         if i % axes.shape[1] == 0:
             ax.set_ylabel(target_col)
-        col = features.columns[col_idx]
+        x, y = features.loc[:, col].values[sample], target.values[sample]
         if drop_outliers:
-            inliers = _find_inliers(features.loc[:, col])
-            ax.scatter(features.loc[inliers, col], target[inliers],
-                       alpha=scatter_alpha, s=scatter_size)
-        else:
-            ax.scatter(features.loc[:, col], target,
-                       alpha=scatter_alpha, s=scatter_size)
+            inliers = _find_inliers(features.loc[:, col]).values[sample]
+            x, y = x[inliers], y[inliers]
+        ax.scatter(x, y, alpha=scatter_alpha, s=scatter_size)
         ax.set_xlabel(_shortname(col))
         ax.set_title("F={:.2E}".format(f[col_idx]))
 
@@ -118,20 +190,19 @@ def plot_regression_categorical(X, target_col, types=None, **kwargs):
     features = features.astype('category')
     show_top = _get_n_top(features, "categorical")
 
-    # can't use OrdinalEncoder because we might have mix of int and string
-    ordinal_encoded = features.apply(lambda x: x.cat.codes)
+    ordinal_encoded = _ordinal_encode(features)
     target = X[target_col]
-    f = mutual_info_regression(
-        ordinal_encoded, target,
-        discrete_features=np.ones(X.shape[1], dtype=bool))
-    top_k = np.argsort(f)[-show_top:][::-1]
+    f = _mutual_info(ordinal_encoded, target, task="regression",
+                     discrete_features=True)
+    top_k = _top_k(f, show_top)
 
     # large number of categories -> taller plot
-    row_height = 3 if X.nunique().max() <= 5 else 5
+    row_height = 5 if _any_col_exceeds(features, 5) else 3
     fig, axes = _make_subplots(n_plots=show_top, row_height=row_height)
     plt.suptitle("Categorical Feature vs Target")
-    for i, (col_ind, ax) in enumerate(zip(top_k, axes.ravel())):
-        col = features.columns[i]
+    col_names = features.columns[top_k]
+    for i, (col_ind, col, ax) in enumerate(zip(top_k, col_names,
+                                                axes.ravel())):
         X_new = _prune_category_make_X(X, col, target_col)
         medians = X_new.groupby(col)[target_col].median()
         order = medians.sort_values().index
@@ -149,8 +220,8 @@ def plot_classification_continuous(X, target_col, types=None, hue_order=None,
                                    scatter_alpha='auto', scatter_size="auto",
                                    univariate_plot='histogram',
                                    drop_outliers=True, plot_pairwise=True,
-                                   top_k_interactions=10,
-                                   **kwargs):
+                                   top_k_interactions=10, features_imp=None,
+                                   max_scatter_points=5000, **kwargs):
     """Exploration plots for continuous features in classification.
 
     Selects important continuous features according to F statistics.
@@ -162,6 +233,9 @@ def plot_classification_continuous(X, target_col, types=None, hue_order=None,
     Scatter plots are determined "interesting" is a decision tree on the
     two-dimensional projection performs well. The cross-validated macro-average
     recall of a decision tree is shown in the title for each scatterplot.
+    PCA directions are only shown if there are more than
+    ``1.5 * top_k_interactions`` features, as they add little over the
+    scatterplots of the original features otherwise.
 
     Parameters
     ----------
@@ -187,6 +261,13 @@ def plot_classification_continuous(X, target_col, types=None, hue_order=None,
         (ranked by univariate f scores).
         Runtime is quadratic in this, but higher numbers might find more
         interesting interactions.
+    features_imp : ndarray, optional
+        Continuous features (excluding the target) with missing values
+        imputed. Can be used to avoid recomputing the imputation.
+    max_scatter_points : int or None, default=5000
+        Maximum number of points to show in scatter plots. Larger datasets
+        are subsampled for plotting, with an equal share for every class.
+        None means show all points.
 
     Notes
     -----
@@ -201,11 +282,19 @@ def plot_classification_continuous(X, target_col, types=None, hue_order=None,
     if features.shape[1] == 0:
         return
 
-    features_imp = SimpleImputer().fit_transform(features)
+    if features_imp is None:
+        features_imp = SimpleImputer().fit_transform(features)
+    # single precision is plenty for plotting, and halves memory traffic
+    # (decision trees convert to float32 anyway)
+    features_imp = features_imp.astype(np.float32, copy=False)
     target = X[target_col]
+    # only used for drawing, all computations use the full data
+    sample = _get_scatter_sample(target, max_scatter_points, stratify=True)
+    target_sample = target.iloc[sample]
 
     if features.shape[1] <= 5:
-        pairplot(X, target_col=target_col, columns=features.columns,
+        pairplot(X.iloc[sample], target_col=target_col,
+                 columns=features.columns,
                  scatter_alpha=scatter_alpha,
                  scatter_size=scatter_size)
         plt.suptitle("Continuous features pairplot", y=1.02)
@@ -213,36 +302,43 @@ def plot_classification_continuous(X, target_col, types=None, hue_order=None,
         # univariate plots
         show_top = _get_n_top(features, "continuous")
         f, p = f_classif(features_imp, target)
-        top_k = np.argsort(f)[-show_top:][::-1]
+        top_k = _top_k(f, show_top)
         # FIXME this will fail if a feature is always
         # NaN for a particular class
-        best_features = features.iloc[:, top_k].copy()
+        best_features = features.iloc[:, top_k]
 
         if drop_outliers:
-            for col in best_features.columns:
-                inliers = _find_inliers(best_features.loc[:, col])
-                best_features[~inliers] = np.NaN
+            best_features = _drop_outliers(best_features)
+        else:
+            best_features = best_features.copy()
 
         best_features[target_col] = target
 
         if univariate_plot == 'kde':
-            df = best_features.melt(target_col)
-            rows, cols = find_pretty_grid(show_top)
-
-            g = sns.FacetGrid(df, col='variable', hue=target_col,
-                              col_wrap=cols,
-                              sharey=False, sharex=False, hue_order=hue_order)
-            g = g.map(sns.kdeplot, "value", shade=True)
-            g.axes[0].legend()
+            if hue_order is None:
+                hue_order = np.unique(target)
+            fig, axes = _make_subplots(n_plots=show_top)
+            for i, (ind, col, ax) in enumerate(
+                    zip(top_k, best_features.columns, axes.ravel())):
+                for name in hue_order:
+                    class_values = best_features.loc[target == name, col]
+                    sns.kdeplot(class_values.dropna(), ax=ax, shade=True,
+                                label=name)
+                ax.set_title("F={:.2E}".format(f[ind]))
+            for j in range(i + 1, axes.size):
+                # turn off axis if we didn't fill last row
+                axes.ravel()[j].set_axis_off()
+            axes.ravel()[0].legend()
             plt.suptitle("Continuous features by target", y=1.02)
         elif univariate_plot == 'histogram':
             # row_height = 3 if target.nunique() < 5 else 5
             n_classes = target.nunique()
             row_height = n_classes * 1 if n_classes < 10 else n_classes * .5
             fig, axes = _make_subplots(n_plots=show_top, row_height=row_height)
-            for i, (ind, ax) in enumerate(zip(top_k, axes.ravel())):
-                class_hists(best_features, best_features.columns[i],
-                            target_col, ax=ax, legend=i == 0)
+            for i, (ind, col, ax) in enumerate(
+                    zip(top_k, best_features.columns, axes.ravel())):
+                class_hists(best_features, col, target_col, ax=ax,
+                            legend=i == 0)
                 ax.set_title("F={:.2E}".format(f[ind]))
             for j in range(i + 1, axes.size):
                 # turn off axis if we didn't fill last row
@@ -251,26 +347,27 @@ def plot_classification_continuous(X, target_col, types=None, hue_order=None,
             raise ValueError("Unknown value for univariate_plot: ",
                              univariate_plot)
 
-        # FIXME remove "variable = " from title, add f score
-
         # pairwise plots
         if not plot_pairwise:
             return
-        top_k = np.argsort(f)[-top_k_interactions:][::-1]
+        top_k = _top_k(f, top_k_interactions)
+        # a single (contiguous) copy of the selected features, used for both
+        # the pair search and the scatter plots
+        top_k_features = features_imp[:, top_k]
         top_pairs = _find_scatter_plots_classification(
-            features_imp[:, top_k], target, how_many=4)
+            top_k_features, target, how_many=4)
+        col_names = features.columns[top_k]
         fig, axes = plt.subplots(1, len(top_pairs),
                                  figsize=(len(top_pairs) * 4, 4),
                                  constrained_layout=True)
         for x, y, score, ax in zip(top_pairs.feature0, top_pairs.feature1,
                                    top_pairs.score, axes.ravel()):
-            i = top_k[x]
-            j = top_k[y]
-            discrete_scatter(features_imp[:, i], features_imp[:, j],
-                             c=target, ax=ax, alpha=scatter_alpha,
+            discrete_scatter(top_k_features[sample, x],
+                             top_k_features[sample, y],
+                             c=target_sample, ax=ax, alpha=scatter_alpha,
                              s=scatter_size)
-            ax.set_xlabel(features.columns[i])
-            ax.set_ylabel(features.columns[j])
+            ax.set_xlabel(col_names[x])
+            ax.set_ylabel(col_names[y])
             ax.set_title("{:.3f}".format(score))
         fig.suptitle("Top feature interactions")
     if not plot_pairwise:
@@ -282,34 +379,40 @@ def plot_classification_continuous(X, target_col, types=None, hue_order=None,
                        features.shape[1])
     if n_components < 2:
         return
-    pca = PCA(n_components=n_components)
-    features_scaled = scale(features_imp)
-    features_pca = pca.fit_transform(features_scaled)
-    top_pairs = _find_scatter_plots_classification(
-        features_pca, target, how_many=3)
-    # copy and paste from above. Refactor?
-    fig, axes = plt.subplots(1, len(top_pairs) + 1,
-                             figsize=((len(top_pairs) + 1) * 4, 4),
-                             constrained_layout=True)
-    if len(top_pairs) <= 1:
-        # we don't want ravel to fail, this is awkward!
-        axes = np.array([axes])
-    for x, y, score, ax in zip(top_pairs.feature0, top_pairs.feature1,
-                               top_pairs.score, axes.ravel()):
+    # StandardScaler keeps float32 and, unlike scale, doesn't warn about
+    # float32 rounding errors after centering
+    features_scaled = StandardScaler().fit_transform(features_imp)
+    # with few features, PCA directions add little over the pairs of
+    # original features we already searched
+    if features.shape[1] > 1.5 * top_k_interactions:
+        pca = PCA(n_components=n_components, svd_solver='randomized',
+                  random_state=0)
+        features_pca = pca.fit_transform(features_scaled)
+        top_pairs = _find_scatter_plots_classification(
+            features_pca, target, how_many=3)
+        # copy and paste from above. Refactor?
+        fig, axes = plt.subplots(1, len(top_pairs) + 1,
+                                 figsize=((len(top_pairs) + 1) * 4, 4),
+                                 constrained_layout=True)
+        if len(top_pairs) <= 1:
+            # we don't want ravel to fail, this is awkward!
+            axes = np.array([axes])
+        for x, y, score, ax in zip(top_pairs.feature0, top_pairs.feature1,
+                                   top_pairs.score, axes.ravel()):
 
-        discrete_scatter(features_pca[:, x], features_pca[:, y],
-                         c=target, ax=ax, alpha=scatter_alpha,
-                         s=scatter_size)
-        ax.set_xlabel("PCA {}".format(x))
-        ax.set_ylabel("PCA {}".format(y))
-        ax.set_title("{:.3f}".format(score))
-    ax = axes.ravel()[-1]
-    ax.plot(pca.explained_variance_ratio_, label='variance')
-    ax.plot(np.cumsum(pca.explained_variance_ratio_),
-            label='cumulative variance')
-    ax.set_title("Scree plot (PCA explained variance)")
-    ax.legend()
-    fig.suptitle("Discriminating PCA directions")
+            discrete_scatter(features_pca[sample, x], features_pca[sample, y],
+                             c=target_sample, ax=ax, alpha=scatter_alpha,
+                             s=scatter_size)
+            ax.set_xlabel("PCA {}".format(x))
+            ax.set_ylabel("PCA {}".format(y))
+            ax.set_title("{:.3f}".format(score))
+        ax = axes.ravel()[-1]
+        ax.plot(pca.explained_variance_ratio_, label='variance')
+        ax.plot(np.cumsum(pca.explained_variance_ratio_),
+                label='cumulative variance')
+        ax.set_title("Scree plot (PCA explained variance)")
+        ax.legend()
+        fig.suptitle("Discriminating PCA directions")
     # LDA
 
     lda = LinearDiscriminantAnalysis(
@@ -317,7 +420,9 @@ def plot_classification_continuous(X, target_col, types=None, hue_order=None,
     features_lda = lda.fit_transform(features_scaled, target)
     # we should probably do macro-average recall here as everywhere else?
     print("Linear Discriminant Analysis training set score: {:.3f}".format(
-          recall_score(target, lda.predict(features_scaled), average='macro')))
+          recall_score(target, _lda_predict(lda, features_lda,
+                                            features_scaled),
+                       average='macro')))
     if features_lda.shape[1] < 2:
         # Do a single plot and exit
         plt.figure()
@@ -338,8 +443,8 @@ def plot_classification_continuous(X, target_col, types=None, hue_order=None,
     for x, y, score, ax in zip(top_pairs.feature0, top_pairs.feature1,
                                top_pairs.score, axes.ravel()):
 
-        discrete_scatter(features_lda[:, x], features_lda[:, y],
-                         c=target, ax=ax, alpha=scatter_alpha,
+        discrete_scatter(features_lda[sample, x], features_lda[sample, y],
+                         c=target_sample, ax=ax, alpha=scatter_alpha,
                          s=scatter_size)
         ax.set_xlabel("LDA {}".format(x))
         ax.set_ylabel("LDA {}".format(y))
@@ -396,39 +501,42 @@ def plot_classification_categorical(X, target_col, types=None, kind='auto',
 
     show_top = _get_n_top(features, "categorical")
 
-    # can't use OrdinalEncoder because we might have mix of int and string
-    ordinal_encoded = features.apply(lambda x: x.cat.codes)
+    ordinal_encoded = _ordinal_encode(features)
     target = X[target_col]
-    f = mutual_info_classif(
-        ordinal_encoded, target,
-        discrete_features=np.ones(X.shape[1], dtype=bool))
-    top_k = np.argsort(f)[-show_top:][::-1]
+    f = _mutual_info(ordinal_encoded, target, task="classification",
+                     discrete_features=True)
+    top_k = _top_k(f, show_top)
     # large number of categories -> taller plot
-    row_height = 3 if features.nunique().max() <= 5 else 5
+    row_height = 5 if _any_col_exceeds(features, 5) else 3
     fig, axes = _make_subplots(n_plots=show_top, row_height=row_height)
     plt.suptitle("Categorical Features vs Target", y=1.02)
-    for i, (col_ind, ax) in enumerate(zip(top_k, axes.ravel())):
-        col = features.columns[col_ind]
+    col_names = features.columns[top_k]
+    for i, (col_ind, col, ax) in enumerate(zip(top_k, col_names,
+                                                axes.ravel())):
+        # computed once and shared with _prune_category_make_X
+        value_counts = X[col].value_counts()
         if kind == 'proportion':
-            X_new = _prune_category_make_X(X, col, target_col)
+            X_new = _prune_category_make_X(X, col, target_col,
+                                           value_counts=value_counts)
 
-            df = (X_new.groupby(col)[target_col]
-                  .value_counts(normalize=True)
-                  .unstack()
+            df = (pd.crosstab(X_new[col], X_new[target_col],
+                              normalize='index')
                   .sort_values(by=target[0]))  # hacky way to get a class name
             df.plot(kind='barh', stacked='True', ax=ax, legend=i == 0)
             ax.set_title(col)
             ax.set_ylabel(None)
         elif kind == 'mosaic':
             # how many categories make up at least 1% of data:
-            n_cats = (X[col].value_counts() / len(X) > 0.01).sum()
+            n_cats = (value_counts / len(X) > 0.01).sum()
             n_cats = np.minimum(n_cats, 20)
             X_new = _prune_category_make_X(X, col, target_col,
-                                           max_categories=n_cats)
+                                           max_categories=n_cats,
+                                           value_counts=value_counts)
             mosaic_plot(X_new, col, target_col, ax=ax)
             ax.set_title(col)
         elif kind == 'count':
-            X_new = _prune_category_make_X(X, col, target_col)
+            X_new = _prune_category_make_X(X, col, target_col,
+                                           value_counts=value_counts)
 
             # absolute counts
             # FIXME show f value
@@ -448,7 +556,7 @@ def plot_classification_categorical(X, target_col, types=None, kind='auto',
 
 def plot(X, target_col, type_hints=None, scatter_alpha='auto',
          scatter_size='auto', verbose=10, plot_pairwise=True,
-         **kwargs):
+         max_scatter_points=5000, **kwargs):
     """Exploration plots for classification and regression.
 
     Determines whether the target is categorical or continuous and plots the
@@ -472,6 +580,9 @@ def plot(X, target_col, type_hints=None, scatter_alpha='auto',
     plot_pairwise : bool, default=True
         Whether to include pairwise scatterplots for classification.
         These can be somewhat expensive to compute.
+    max_scatter_points : int or None, default=5000
+        Maximum number of points to show in scatter plots. Larger datasets
+        are subsampled for plotting. None means show all points.
     verbose : int, default=10
         Controls the verbosity (output).
 
@@ -496,6 +607,13 @@ def plot(X, target_col, type_hints=None, scatter_alpha='auto',
                 types.loc[col, 'low_card_int'] = False
                 types.loc[col, 'categorical'] = True
 
+    features = X.loc[:, types.continuous]
+    if target_col in features.columns:
+        features = features.drop(target_col, axis=1)
+    if features.shape[1] > 0:
+        # impute once and share it between the plotting functions
+        kwargs['features_imp'] = SimpleImputer().fit_transform(features)
+
     if types.continuous[target_col]:
         print("Target looks like regression")
         # FIXME are might be overwriting the original dataframe here?
@@ -507,15 +625,24 @@ def plot(X, target_col, type_hints=None, scatter_alpha='auto',
         plt.xlabel(target_col)
         plt.ylabel("frequency")
         plt.title("Target distribution")
-        scatter_alpha = _get_scatter_alpha(scatter_alpha, X[target_col])
-        scatter_size = _get_scatter_size(scatter_size, X[target_col])
+        # the scatter plots show at most max_scatter_points samples
+        shown = X[target_col].iloc[:max_scatter_points]
+        scatter_alpha = _get_scatter_alpha(scatter_alpha, shown)
+        scatter_size = _get_scatter_size(scatter_size, shown)
 
         plot_regression_continuous(X, target_col, types=types,
                                    scatter_alpha=scatter_alpha,
-                                   scatter_size=scatter_size, **kwargs)
+                                   scatter_size=scatter_size,
+                                   max_scatter_points=max_scatter_points,
+                                   **kwargs)
         plot_regression_categorical(X, target_col, types=types, **kwargs)
     else:
         print("Target looks like classification")
+        if 'features_imp' in kwargs:
+            # cast here so the float64 array isn't kept alongside the
+            # float32 copy of plot_classification_continuous
+            kwargs['features_imp'] = kwargs['features_imp'].astype(
+                np.float32)
         # regression
         # make sure we include the target column in X
         # even though it's not categorical
@@ -534,6 +661,7 @@ def plot(X, target_col, type_hints=None, scatter_alpha='auto',
         plot_classification_continuous(
             X, target_col, types=types, hue_order=counts.index,
             scatter_alpha=scatter_alpha, scatter_size=scatter_size,
-            plot_pairwise=plot_pairwise, **kwargs)
+            plot_pairwise=plot_pairwise,
+            max_scatter_points=max_scatter_points, **kwargs)
         plot_classification_categorical(X, target_col, types=types,
                                         hue_order=counts.index, **kwargs)
@@ -7,11 +7,13 @@ import itertools
 
 from sklearn.datasets import make_regression, make_blobs, load_digits
 from sklearn.preprocessing import KBinsDiscretizer
+from sklearn.discriminant_analysis import LinearDiscriminantAnalysis
 from dabl.preprocessing import clean, detect_types
+from dabl.plot import supervised
 from dabl.plot.supervised import (
     plot, plot_classification_categorical,
     plot_classification_continuous, plot_regression_categorical,
-    plot_regression_continuous)
+    plot_regression_continuous, _mutual_info, _lda_predict)
 from dabl.utils import data_df_from_bunch
 
 
@@ -130,3 +132,158 @@ def test_plot_target_low_card_int():
     data = load_digits()
     df = data_df_from_bunch(data)
     plot(df[::10], target_col='target')
+
+
+def test_mutual_info_cached():
+    X = np.random.randint(4, size=(100, 3)).astype(np.int8)
+    y = pd.Series(np.random.randint(2, size=100))
+    f = _mutual_info(X, y, "classification", True)
+    # same content, different objects
+    assert _mutual_info(X.copy(), y.copy(), "classification", True) is f
+    assert _mutual_info(X.copy(), y.copy(), "regression", True) is not f
+    X[0, 0] = 5
+    assert _mutual_info(X, y, "classification", True) is not f
+
+
+@pytest.mark.parametrize("task", ["classification", "regression"])
+def test_plot_max_scatter_points(task):
+    X, y = make_blobs(n_samples=300, n_features=7, random_state=0)
+    X = pd.DataFrame(X)
+    if task == "classification":
+        X['target'] = y
+        X['target'] = X['target'].astype('category')
+        plot_classification_continuous(X, 'target', max_scatter_points=60)
+    else:
+        X['target'] = X[0] + X[1]
+        plot_regression_continuous(X, 'target', max_scatter_points=60,
+                                   scatter_alpha=.5, scatter_size=2,
+                                   drop_outliers=False)
+    ax = plt.gcf().axes[0]
+    n_points = sum(len(c.get_offsets()) for c in ax.collections)
+    assert n_points == 60
+    plt.close("all")
+
+
+def test_plot_max_scatter_points_pairplot():
+    X, y = make_blobs(n_samples=300, n_features=3, random_state=0)
+    X = pd.DataFrame(X)
+    X['target'] = y
+    X['target'] = X['target'].astype('category')
+    plt.close("all")
+    plot_classification_continuous(X, 'target', max_scatter_points=60)
+    # the pairplot is the first figure
+    pairplot_fig = plt.figure(plt.get_fignums()[0])
+    n_points = [sum(len(c.get_offsets()) for c in ax.collections)
+                for ax in pairplot_fig.axes]
+    assert max(n_points) == 60
+    plt.close("all")
+
+
+def test_plot_scatter_auto_alpha_max_scatter_points(monkeypatch):
+    X, y = make_regression(n_samples=2000, n_features=7, random_state=0)
+    X = pd.DataFrame(X)
+    X['target'] = y
+    recorded = {}
+
+    def plot_regression_continuous(X, target_col, **kwargs):
+        recorded.update(kwargs)
+    monkeypatch.setattr(supervised, "plot_regression_continuous",
+                        plot_regression_continuous)
+    plot(X, target_col='target', max_scatter_points=500)
+    assert recorded['scatter_alpha'] == .5
+    assert recorded['scatter_size'] == 30
+    plt.close("all")
+
+
+@pytest.mark.parametrize("task", ["classification", "regression"])
+def test_plot_shares_features_imp(task, monkeypatch):
+    X, y = make_blobs(n_samples=100, n_features=7, random_state=0)
+    X = pd.DataFrame(X)
+    if task == "classification":
+        X['target'] = y
+    else:
+        X['target'] = X[0] + X[1]
+    recorded = {}
+
+    def plot_continuous(X, target_col, **kwargs):
+        recorded.update(kwargs)
+    monkeypatch.setattr(supervised, "plot_{}_continuous".format(task),
+                        plot_continuous)
+    plot(X, target_col='target')
+    # only the classification plots use single precision
+    if task == "classification":
+        assert recorded['features_imp'].dtype == np.float32
+    else:
+        assert recorded['features_imp'].dtype == np.float64
+    plt.close("all")
+
+
+@pytest.mark.parametrize("univariate_plot", ['histogram', 'kde'])
+def test_plot_classification_continuous_univariate(univariate_plot):
+    X, y = make_blobs(n_samples=100, n_features=7, random_state=0)
+    X = pd.DataFrame(X)
+    X['target'] = y
+    X['target'] = X['target'].astype('category')
+    plot_classification_continuous(X, 'target', plot_pairwise=False,
+                                   univariate_plot=univariate_plot)
+    axes = plt.gcf().axes
+    assert len(axes) == 8
+    assert axes[0].get_title().startswith("F=")
+    plt.close("all")
+
+
+def test_mutual_info_subsample(monkeypatch):
+    monkeypatch.setattr(supervised, "_MI_MAX_SAMPLES", 50)
+    monkeypatch.setattr(supervised, "_MI_CACHE", {})
+    recorded = []
+
+    def mutual_info_classif(X, y, **kwargs):
+        recorded.append((X, y))
+        return np.zeros(X.shape[1])
+    monkeypatch.setattr(supervised, "mutual_info_classif",
+                        mutual_info_classif)
+    X = np.random.randint(4, size=(100, 3)).astype(np.int8)
+    y = pd.Series(X[:, 0] > 1)
+    f = _mutual_info(X, y, "classification", True)
+    assert f.shape == (3,)
+    X_sub, y_sub = recorded[0]
+    assert X_sub.shape == (50, 3)
+    assert len(y_sub) == 50
+    # rows and labels are subsampled together
+    assert np.all(y_sub.values == (X_sub[:, 0] > 1))
+
+
+@pytest.mark.parametrize("n_classes, n_components", [(2, 1), (4, 3), (4, 2)])
+def test_lda_predict(n_classes, n_components):
+    X, y = make_blobs(n_samples=200, centers=n_classes, n_features=10,
+                      cluster_std=5, random_state=0)
+    lda = LinearDiscriminantAnalysis(n_components=n_components)
+    X_lda = lda.fit_transform(X, y)
+    assert np.all(_lda_predict(lda, X_lda, X) == lda.predict(X))
+
+
+@pytest.mark.parametrize("kind", ['count', 'proportion', 'mosaic'])
+def test_plot_classification_categorical_kind(kind):
+    rng = np.random.RandomState(0)
+    X = pd.DataFrame(rng.randint(4, size=(100, 3)),
+                     columns=['a', 'b', 'c']).astype('category')
+    X['target'] = pd.Categorical(np.where(X.a.astype(int) > 1, 'x', 'y'))
+    plot_classification_categorical(X, 'target', kind=kind)
+    if kind != 'count':
+        # most informative feature comes first
+        assert plt.gcf().axes[0].get_title() == 'a'
+    plt.close("all")
+
+
+@pytest.mark.parametrize("n_features", [7, 20])
+def test_plot_classification_continuous_pca(n_features):
+    X, y = make_blobs(n_samples=100, n_features=n_features, random_state=0)
+    X = pd.DataFrame(X)
+    X['target'] = y
+    X['target'] = X['target'].astype('category')
+    plot_classification_continuous(X, 'target', top_k_interactions=10)
+    titles = [plt.figure(i)._suptitle.get_text()
+              for i in plt.get_fignums() if plt.figure(i)._suptitle]
+    assert ("Discriminating PCA directions" in titles) == (n_features > 15)
+    assert "Discriminating LDA directions" in titles
+    plt.close("all")
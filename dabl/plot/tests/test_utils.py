@@ -1,10 +1,13 @@
 import pytest
 import numpy as np
+import pandas as pd
 import matplotlib.pyplot as plt
 from sklearn.datasets import load_iris
 
 from dabl.utils import data_df_from_bunch
-from dabl.plot.utils import find_pretty_grid, plot_coefficients, pairplot
+from dabl.plot.utils import (find_pretty_grid, plot_coefficients, pairplot,
+                             _top_k, _get_scatter_sample, _find_inliers,
+                             _drop_outliers, class_hists)
 
 
 def test_find_pretty_grid():
@@ -18,6 +21,34 @@ def test_find_pretty_grid():
         assert cols <= max_cols
 
 
+@pytest.mark.parametrize("k", [1, 5, 10, 20])
+def test_top_k(k):
+    rng = np.random.RandomState(0)
+    scores = rng.normal(size=10)
+    assert np.all(_top_k(scores, k) == np.argsort(scores)[-k:][::-1])
+
+
+def test_get_scatter_sample():
+    target = np.repeat([0, 1, 2], [10, 100, 1000])
+    assert len(_get_scatter_sample(target, None)) == len(target)
+    assert len(_get_scatter_sample(target, 2000)) == len(target)
+    sample = _get_scatter_sample(target, 90)
+    assert len(sample) == 90
+    sample = _get_scatter_sample(target, 90, stratify=True)
+    assert np.all(np.bincount(target[sample]) == [10, 30, 30])
+
+
+@pytest.mark.filterwarnings('ignore:Dropped')
+def test_drop_outliers():
+    rng = np.random.RandomState(0)
+    data = pd.DataFrame(rng.standard_cauchy(size=(200, 3)))
+    data.iloc[:5, 1] = np.NaN
+    dropped = _drop_outliers(data)
+    for col in data.columns:
+        inliers = _find_inliers(data[col])
+        assert np.all(dropped[col].isna() == (~inliers | data[col].isna()))
+
+
 @pytest.mark.parametrize("n_features, n_top_features",
                          [(5, 10), (10, 5), (10, 40), (40, 10)])
 def test_plot_coefficients(n_features, n_top_features):
@@ -35,3 +66,22 @@ def test_plot_coefficients(n_features, n_top_features):
 def test_pairplot_iris():
     data = data_df_from_bunch(load_iris())
     pairplot(data, target_col='target')
+
+
+@pytest.mark.parametrize("bins", ["auto", np.linspace(-1, 1, 11)])
+def test_class_hists_matches_histogram(bins):
+    rng = np.random.RandomState(0)
+    x = rng.normal(size=300)
+    x[::10] = np.nan
+    y = rng.choice(['a', 'b', 'c'], size=300)
+    df = pd.DataFrame({'x': x, 'y': y})
+    fig, ax = plt.subplots()
+    class_hists(df, 'x', 'y', bins=bins, ax=ax)
+    bin_edges = np.histogram_bin_edges(df.x.dropna(), bins=bins)
+    n_bins = len(bin_edges) - 1
+    heights = [p.get_height() for p in ax.patches]
+    for i, c in enumerate(['a', 'b', 'c']):
+        expected, _ = np.histogram(x[(y == c) & ~np.isnan(x)],
+                                   bins=bin_edges)
+        assert heights[i * n_bins:(i + 1) * n_bins] == list(expected)
+    plt.close(fig)
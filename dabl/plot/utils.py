@@ -16,6 +16,7 @@ from sklearn.tree import DecisionTreeClassifier
 from sklearn.metrics import roc_curve
 
 from sklearn.model_selection import cross_val_score, StratifiedShuffleSplit
+from sklearn.utils._joblib import Parallel, delayed
 
 
 from ..preprocessing import detect_types
@@ -263,20 +264,48 @@ def _get_n_top(features, name):
     return show_top
 
 
-def _prune_categories(series, max_categories=10):
+def _top_k(scores, k):
+    """Indices of the k largest scores, in decreasing order.
+
+    Uses a partial sort, so only the k selected scores are fully sorted.
+    """
+    scores = np.asarray(scores)
+    k = min(k, len(scores))
+    idx = np.argpartition(scores, -k)[-k:]
+    return idx[np.argsort(scores[idx])[::-1]]
+
+
+def _any_col_exceeds(features, threshold):
+    """Whether any categorical column has more than threshold categories.
+
+    Stops at the first column that does, and only looks at the categories,
+    not at the data.
+    """
+    return any(len(features[col].cat.categories) > threshold
+               for col in features.columns)
+
+
+def _prune_categories(series, max_categories=10, value_counts=None):
     series = series.astype('category')
-    small_categories = series.value_counts()[max_categories:].index
+    if value_counts is None:
+        value_counts = series.value_counts()
+    small_categories = value_counts[max_categories:].index
     res = series.cat.remove_categories(small_categories)
     res = res.cat.add_categories(['dabl_other']).fillna("dabl_other")
     return res
 
 
-def _prune_category_make_X(X, col, target_col, max_categories=20):
+def _prune_category_make_X(X, col, target_col, max_categories=20,
+                           value_counts=None):
+    # value_counts of X[col] can be passed to avoid recomputing them
     col_values = X[col]
-    if col_values.nunique() > max_categories:
+    if value_counts is None:
+        value_counts = col_values.value_counts()
+    if (value_counts > 0).sum() > max_categories:
         # keep only top 10 categories if there are more than 20
         col_values = _prune_categories(col_values,
-                                       max_categories=min(10, max_categories))
+                                       max_categories=min(10, max_categories),
+                                       value_counts=value_counts)
         X_new = X[[target_col]].copy()
         X_new[col] = col_values
     else:
@@ -342,24 +371,29 @@ def _short_tick_names(ax):
     ax.set_ylabel(_shortname(ax.get_ylabel(), maxlen=20))
 
 
-def _find_scatter_plots_classification(X, target, how_many=3):
+def _score_scatter_pair(X, target, i, j, cv):
+    this_X = X[:, [i, j]]
+    # assume this tree is simple enough so not be able to overfit in 2d
+    # so we don't bother with train/test split
+    tree = DecisionTreeClassifier(max_leaf_nodes=8)
+    return i, j, np.mean(cross_val_score(tree, this_X, target, cv=cv,
+                                         scoring='recall_macro'))
+
+
+def _find_scatter_plots_classification(X, target, how_many=3, n_jobs=-1):
     # input is continuous
     # look at all pairs of features, find most promising ones
     # dummy = DummyClassifier(strategy='prior').fit(X, target)
     # baseline_score = recall_score(target, dummy.predict(X), average='macro')
-    scores = []
     # converting to int here might save some time
     _, target = np.unique(target, return_inverse=True)
     # limit to 2000 training points for speed?
     train_size = min(2000, int(.9 * X.shape[0]))
     cv = StratifiedShuffleSplit(n_splits=3, train_size=train_size)
-    for i, j in itertools.combinations(np.arange(X.shape[1]), 2):
-        this_X = X[:, [i, j]]
-        # assume this tree is simple enough so not be able to overfit in 2d
-        # so we don't bother with train/test split
-        tree = DecisionTreeClassifier(max_leaf_nodes=8)
-        scores.append((i, j, np.mean(cross_val_score(
-            tree, this_X, target, cv=cv, scoring='recall_macro'))))
+    # tree fitting releases the GIL, so threads avoid copying X around
+    scores = Parallel(n_jobs=n_jobs, prefer='threads')(
+        delayed(_score_scatter_pair)(X, target, i, j, cv)
+        for i, j in itertools.combinations(np.arange(X.shape[1]), 2))
 
     scores = pd.DataFrame(scores, columns=['feature0', 'feature1', 'score'])
     top = scores.sort_values(by='score').iloc[-how_many:][::-1]
@@ -448,11 +482,23 @@ def class_hists(data, column, target, bins="auto", ax=None, legend=False):
         if len(bin_edges) > 30:
             bin_edges = np.histogram_bin_edges(col_data, bins=30)
 
-        counts = {}
-        for name, group in data.groupby(target)[column]:
-            this_counts, _ = np.histogram(group, bins=bin_edges)
-            counts[name] = this_counts
-        counts = pd.DataFrame(counts)
+        # bin all values once, then count bins per class
+        classes = data[target].astype('category')
+        class_codes = classes.cat.codes.values
+        values = data[column].values
+        # like np.histogram, ignore missing values and values outside the
+        # bin edges (comparisons with NaN are False)
+        valid = ((class_codes >= 0) & (values >= bin_edges[0])
+                 & (values <= bin_edges[-1]))
+        n_bins = len(bin_edges) - 1
+        bin_idx = np.searchsorted(bin_edges, values[valid], side='right') - 1
+        # the last bin includes its right edge, like in np.histogram
+        bin_idx = np.minimum(bin_idx, n_bins - 1)
+        n_classes = len(classes.cat.categories)
+        counts = np.bincount(class_codes[valid] * n_bins + bin_idx,
+                             minlength=n_classes * n_bins)
+        counts = pd.DataFrame(counts.reshape(n_classes, n_bins).T,
+                              columns=classes.cat.categories)
     else:
         ordinal = True
         # ordinal data, count distinct values
@@ -550,6 +596,27 @@ def _find_inliers(series):
     return mask
 
 
+def _drop_outliers(data):
+    """Replace outliers in each column of data by NaN.
+
+    Uses the same ranges as _find_inliers, computed for all columns at once.
+    Returns a new float DataFrame.
+    """
+    values = data.values.astype(np.float64)
+    low = np.nanquantile(values, 0.01, axis=0)
+    high = np.nanquantile(values, 0.99, axis=0)
+    # the two is a complete hack
+    inner_range = (high - low) / 2
+    outliers = ((values < low - inner_range)
+                | (values > high + inner_range))
+    values[outliers] = np.NaN
+    for col, dropped in zip(data.columns, outliers.sum(axis=0)):
+        if dropped > 0:
+            warn("Dropped {} outliers in column {}.".format(
+                int(dropped), col), UserWarning)
+    return pd.DataFrame(values, columns=data.columns, index=data.index)
+
+
 def _clean_outliers(data):
     def _find_outliers_series(series):
         series = series.dropna()
@@ -567,6 +634,29 @@ def _clean_outliers(data):
     return None
 
 
+def _get_scatter_sample(target, max_points, stratify=False):
+    """Indices of the samples to show in a scatter plot.
+
+    Draws at most max_points samples. With stratify=True, every class in
+    target gets an equal share, so that small classes remain visible.
+    """
+    n_samples = len(target)
+    if max_points is None or n_samples <= max_points:
+        return np.arange(n_samples)
+    rng = np.random.RandomState(0)
+    if not stratify:
+        return np.sort(rng.choice(n_samples, max_points, replace=False))
+    _, target = np.unique(target, return_inverse=True)
+    per_class = max_points // (target.max() + 1)
+    sample = []
+    for k in range(target.max() + 1):
+        class_idx = np.where(target == k)[0]
+        if len(class_idx) > per_class:
+            class_idx = rng.choice(class_idx, per_class, replace=False)
+        sample.append(class_idx)
+    return np.sort(np.concatenate(sample))
+
+
 def _get_scatter_alpha(scatter_alpha, x):
     if scatter_alpha != "auto":
         return scatter_alpha
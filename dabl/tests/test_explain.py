@@ -1,13 +1,18 @@
 import pytest
+import numpy as np
+import pandas as pd
+import matplotlib.pyplot as plt
 
 from sklearn.tree import DecisionTreeClassifier
 from sklearn.pipeline import make_pipeline
 from sklearn.linear_model import LogisticRegression
 from sklearn.ensemble import RandomForestClassifier
 from sklearn.model_selection import train_test_split
+from sklearn.datasets import load_iris
 
 from dabl.datasets import load_titanic
 from dabl import SimpleClassifier, EasyPreprocessor, explain, clean
+from dabl.explain import _exemplar_row, _approximate_partial_dependence
 
 
 def test_explain_smoke_titanic():
@@ -44,3 +49,60 @@ def test_explain_titanic_val(model):
     explain(pipe, feature_names=pipe[0].get_feature_names())
     # with validation set
     explain(pipe, X_val, y_val, feature_names=pipe[0].get_feature_names())
+
+
+@pytest.mark.parametrize("approximate_pd", [False, True])
+def test_explain_multiclass_val(approximate_pd, recwarn):
+    iris = load_iris()
+    X = pd.DataFrame(iris.data, columns=iris.feature_names)
+    X_train, X_val, y_train, y_val = train_test_split(X, iris.target,
+                                                      random_state=42)
+    rf = RandomForestClassifier(n_estimators=10).fit(X_train, y_train)
+    plt.close("all")
+    explain(rf, X_val, y_val, feature_names=X.columns.to_list(),
+            approximate_pd=approximate_pd)
+    assert not any("partial dependence" in str(w.message) for w in recwarn)
+    # roc curve, feature importances and one figure per class
+    assert len(plt.get_fignums()) == 2 + 3
+    for num in plt.get_fignums()[2:]:
+        axes = plt.figure(num).axes
+        assert all(len(ax.lines) == 1 for ax in axes if ax.axison)
+
+
+@pytest.mark.parametrize("approximate_pd", [False, True])
+def test_explain_multiclass_val_array(approximate_pd, recwarn):
+    iris = load_iris()
+    X_train, X_val, y_train, y_val = train_test_split(
+        iris.data, iris.target, random_state=42)
+    rf = RandomForestClassifier(n_estimators=10).fit(X_train, y_train)
+    explain(rf, X_val, y_val, feature_names=iris.feature_names,
+            approximate_pd=approximate_pd)
+    assert not any("partial dependence" in str(w.message) for w in recwarn)
+
+
+def test_exemplar_row():
+    X = pd.DataFrame({'a': [1., 2., 3., 10.],
+                      'b': pd.Categorical(['x', 'y', 'y', 'z']),
+                      'c': [True, False, True, True]})
+    exemplar = _exemplar_row(X)
+    assert exemplar.to_dict() == {'a': 2.5, 'b': 'y', 'c': True}
+    # arrays get integer column labels
+    exemplar = _exemplar_row(X[['a']].values)
+    assert exemplar.to_dict() == {0: 2.5}
+
+
+@pytest.mark.parametrize("n_values", [4, 500])
+def test_approximate_partial_dependence_int_feature(n_values):
+    rng = np.random.RandomState(0)
+    X = pd.DataFrame({'a': rng.randint(n_values, size=1000),
+                      'b': rng.normal(size=1000)})
+    y = X.a % 2
+    rf = RandomForestClassifier(n_estimators=10).fit(X, y)
+    averaged, grid = _approximate_partial_dependence(
+        rf, X, 0, _exemplar_row(X))
+    assert grid.dtype.kind == 'i'
+    if n_values == 4:
+        assert list(grid) == [0, 1, 2, 3]
+    # plotted values are the ones the model was run on
+    X_grid = pd.DataFrame({'a': grid, 'b': X.b.median()})
+    assert np.allclose(averaged[0], rf.predict_proba(X_grid)[:, 1])